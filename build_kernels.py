@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the vesting kernels into the vesting_kernels extension module.
+
+Run once after installing the jit extra (numba.pycc also needs setuptools):
+
+    python build_kernels.py
+
+The resulting extension is serial (pycc can't emit prange loops) and is only
+used where Numba itself isn't installed, e.g. when the built module is shipped
+to a plain pip install. With Numba available the cached parallel JIT is used.
+
+Note: numba.pycc is deprecated upstream and may be removed in a future Numba
+release; the CLI then falls back to the JIT or pure Python batch kernel.
+"""
+
+from numba.pycc import CC
+from calculator_kernels import _vested_batch
+
+cc = CC('vesting_kernels')
+cc.export('vested_batch', 'i8[:](i8[:], i4[:], i4, i4)')(_vested_batch)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,16 +1,49 @@
-from datetime import date, datetime
+from datetime import date
 from typing import List, Optional
+import numpy as np
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, FloatPrompt
 from models import Company, Founder, VestingSchedule, FundingRound
-from validators import StockValidator
+from validators import StockValidator, scan_founders
+from calculator_kernels import _get_compiled_vested_batch
 
 console = Console()
 app = typer.Typer(help="Co-founder Stock Calculator with Vesting Schedules")
 
+# Below this many grants NumPy wins: Numba's import, compile and dispatch
+# overhead only pays back on true batch workloads.
+_NUMBA_THRESHOLD = 256
+
+
+def _vested_numpy(shares_arr: np.ndarray, months_arr: np.ndarray, cliff: int, vest: int) -> np.ndarray:
+    # Same precedence as calculator_kernels._vested: cliff first, then fully vested, then the ramp
+    ramp = (months_arr - cliff) / max(vest - cliff, 1)
+    portion = np.where(months_arr < cliff, 0.0, np.where(months_arr >= vest, 1.0, ramp))
+    return (shares_arr * portion).astype(np.int64)
+
+
+def _vested_numba(shares_arr: np.ndarray, months_arr: np.ndarray, cliff: int, vest: int) -> np.ndarray:
+    return _get_compiled_vested_batch()(shares_arr, months_arr, cliff, vest)
+
+
+def _compute_vesting(shares_arr: np.ndarray, months_arr: np.ndarray, cliff: int, vest: int) -> np.ndarray:
+    if shares_arr.size >= _NUMBA_THRESHOLD:
+        return _vested_numba(shares_arr, months_arr, cliff, vest)
+    return _vested_numpy(shares_arr, months_arr, cliff, vest)
+
+
+def _parse_iso_date(s: str) -> date:
+    """Parse a YYYY-MM-DD string without going through strptime's format interpreter"""
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        year, month, day = s[0:4], s[5:7], s[8:10]
+        # int() would also accept signs, whitespace and non-ASCII digits
+        if all(part.isascii() and part.isdigit() for part in (year, month, day)):
+            return date(int(year), int(month), int(day))
+    return date.fromisoformat(s)
+
 
 def create_company() -> Company:
     console.print("[bold blue]Create New Company[/bold blue]")
@@ -29,7 +62,7 @@ def add_founder(company: Company) -> None:
     
     start_date_str = Prompt.ask("Start date (YYYY-MM-DD)", default=date.today().isoformat())
     try:
-        start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+        start_date = _parse_iso_date(start_date_str)
     except ValueError:
         console.print("[red]Invalid date format. Using today.[/red]")
         start_date = date.today()
@@ -48,24 +81,41 @@ def add_founder(company: Company) -> None:
     console.print(f"[green]Added {name} with {shares:,} shares[/green]")
 
 
-def display_cap_table(company: Company) -> None:
+def _render_rows(rows: List[tuple], name_width: int = 20) -> str:
+    """Format (name, shares, pct) rows as one pre-joined block of text"""
+    return "\n".join(f"{name:<{name_width}}{shares:>15,}{pct:>11.2f}%" for name, shares, pct in rows)
+
+
+def display_cap_table(company: Company, plain: bool = False) -> None:
     if not company.founders:
         console.print("[yellow]No founders added yet.[/yellow]")
         return
     
+    cap_table = company.get_cap_table()
+    remaining = f"{company.get_remaining_shares():,}"
+    
+    if plain:
+        # Batch output: render every row up front and write it in a single call
+        # Size the name column to the longest founder so long names don't break alignment
+        name_width = max(20, max(len(e['founder']) for e in cap_table) + 1)
+        header = f"{'Founder':<{name_width}}{'Shares':>15}{'Ownership %':>12}"
+        rows = _render_rows([(e['founder'], e['shares'], e['ownership_pct']) for e in cap_table], name_width)
+        console.print(f"{company.name} - Cap Table\n{header}\n{rows}\nRemaining shares: {remaining}",
+                      markup=False, highlight=False)
+        return
+    
     table = Table(title=f"{company.name} - Cap Table")
     table.add_column("Founder", style="cyan")
     table.add_column("Shares", style="magenta", justify="right")
     table.add_column("Ownership %", style="green", justify="right")
     table.add_column("Remaining Shares", style="yellow", justify="right")
     
-    cap_table = company.get_cap_table()
     for entry in cap_table:
         table.add_row(
             entry['founder'],
             f"{entry['shares']:,}",
             f"{entry['ownership_pct']:.2f}%",
-            f"{company.get_remaining_shares():,}"
+            remaining
         )
     
     console.print(table)
@@ -79,7 +129,7 @@ def display_vesting_schedule(company: Company) -> None:
     current_date_str = Prompt.ask("Current date for vesting calculation (YYYY-MM-DD)", 
                                  default=date.today().isoformat())
     try:
-        current_date = datetime.strptime(current_date_str, "%Y-%m-%d").date()
+        current_date = _parse_iso_date(current_date_str)
     except ValueError:
         current_date = date.today()
     
@@ -90,24 +140,33 @@ def display_vesting_schedule(company: Company) -> None:
     table.add_column("Unvested Shares", style="red", justify="right")
     table.add_column("Vested %", style="yellow", justify="right")
     
-    for founder in company.founders:
-        schedule = VestingSchedule(
-            founder=founder,
-            vesting_start=founder.start_date,
-            cliff_months=12,
-            vesting_months=48
-        )
-        
-        vested = schedule.calculate_vested_shares(current_date)
-        unvested = schedule.calculate_unvested_shares(current_date)
-        vested_pct = (vested / founder.shares * 100) if founder.shares > 0 else 0
-        
+    cliff_months = 12
+    vesting_months = 48
+    
+    # Vectorized over all founders: one ufunc call per quantity instead of a Python loop
+    shares = np.fromiter((f.shares for f in company.founders), dtype=np.int64, count=len(company.founders))
+    months_elapsed = np.fromiter(
+        ((current_date.year - f.start_date.year) * 12 + (current_date.month - f.start_date.month)
+         for f in company.founders),
+        dtype=np.int32,
+        count=len(company.founders)
+    )
+    not_started = np.fromiter((current_date < f.start_date for f in company.founders),
+                              dtype=bool, count=len(company.founders))
+    # Nothing vests before the start date, even with no cliff
+    months_elapsed[not_started] = -1
+    
+    vested = _compute_vesting(shares, months_elapsed, cliff_months, vesting_months)
+    unvested = shares - vested
+    vested_pct = vested / shares * 100
+    
+    for founder, v, u, pct in zip(company.founders, vested.tolist(), unvested.tolist(), vested_pct.tolist()):
         table.add_row(
             founder.name,
             f"{founder.shares:,}",
-            f"{vested:,}",
-            f"{unvested:,}",
-            f"{vested_pct:.1f}%"
+            f"{v:,}",
+            f"{u:,}",
+            f"{pct:.1f}%"
         )
     
     console.print(table)
@@ -149,18 +208,19 @@ def simulate_funding_round(company: Company) -> None:
     total_shares_before = company.get_total_founder_shares()
     total_shares_after = total_shares_before + new_shares
     
-    for founder in company.founders:
-        original_pct = (founder.shares / total_shares_before * 100) if total_shares_before > 0 else 0
-        new_pct = (founder.shares / total_shares_after * 100) if total_shares_after > 0 else 0
-        dilution = original_pct - new_pct
-        
+    shares = np.fromiter((f.shares for f in company.founders), dtype=np.int64, count=len(company.founders))
+    original_pct = shares / total_shares_before * 100 if total_shares_before > 0 else np.zeros(shares.shape)
+    new_pct = shares / total_shares_after * 100 if total_shares_after > 0 else np.zeros(shares.shape)
+    dilution = original_pct - new_pct
+    
+    for founder, orig, new, dil in zip(company.founders, original_pct.tolist(), new_pct.tolist(), dilution.tolist()):
         table.add_row(
             founder.name,
             f"{founder.shares:,}",
             f"{founder.shares:,}",
-            f"{original_pct:.2f}%",
-            f"{new_pct:.2f}%",
-            f"{dilution:.2f}%"
+            f"{orig:.2f}%",
+            f"{new:.2f}%",
+            f"{dil:.2f}%"
         )
     
     console.print(table)
@@ -193,7 +253,8 @@ def interactive():
             add_founder(company)
         elif choice == "2":
             # Validate before display
-            issues = StockValidator.validate_company_setup(company)
+            scan = scan_founders(company)
+            issues = StockValidator.validate_company_setup(company, scan)
             if issues:
                 console.print("[red]Validation issues:[/red]")
                 for issue in issues:
@@ -203,7 +264,7 @@ def interactive():
             display_cap_table(company)
             
             # Show recommendations
-            recommendations = StockValidator.get_recommendations(company)
+            recommendations = StockValidator.get_recommendations(company, scan)
             if recommendations:
                 console.print("\n[bold yellow]Recommendations:[/bold yellow]")
                 for rec in recommendations:
@@ -259,21 +320,21 @@ def quick_calc(
             company.add_founder(founder)
     
     # Validate before display
-    issues = StockValidator.validate_company_setup(company)
+    scan = scan_founders(company)
+    issues = StockValidator.validate_company_setup(company, scan)
     if issues:
         console.print("[red]Validation issues:[/red]")
         for issue in issues:
             console.print(f"  • {issue}")
         return
     
-    display_cap_table(company)
+    display_cap_table(company, plain=True)
     
     # Show recommendations
-    recommendations = StockValidator.get_recommendations(company)
+    recommendations = StockValidator.get_recommendations(company, scan)
     if recommendations:
-        console.print("\n[bold yellow]Recommendations:[/bold yellow]")
-        for rec in recommendations:
-            console.print(f"  • {rec}")
+        console.print("\n[bold yellow]Recommendations:[/bold yellow]\n" +
+                      "\n".join(f"  • {rec}" for rec in recommendations))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+import numpy as np
+
+# Numba is deliberately not imported here: the scalar kernel is a handful of
+# operations per founder, where JIT dispatch costs more than it saves. Only
+# the batch kernel is compiled, and only on first use (see calculator._compute_vesting).
+
+
+def _vested(shares, months_elapsed, cliff, vesting):
+    """Vested shares for a single grant given whole months since vesting start"""
+    if months_elapsed < cliff:
+        return 0
+    if months_elapsed >= vesting:
+        return shares
+    return int(shares * ((months_elapsed - cliff) / (vesting - cliff)))
+
+
+def _vested_batch(shares_arr, months_arr, cliff, vesting):
+    """Vested shares for many grants sharing the same cliff and vesting period"""
+    out = np.empty(shares_arr.shape[0], dtype=np.int64)
+    for i in range(shares_arr.shape[0]):
+        months = months_arr[i]
+        if months < cliff:
+            out[i] = 0
+        elif months >= vesting:
+            out[i] = shares_arr[i]
+        else:
+            out[i] = int(shares_arr[i] * ((months - cliff) / (vesting - cliff)))
+    return out
+
+
+_compiled_vested_batch = None
+
+
+def _get_compiled_vested_batch():
+    """Return the fastest available batch kernel, loading it on first call
+
+    Prefers Numba's cached parallel JIT kernel, then the ahead-of-time build
+    from build_kernels.py (serial, since pycc can't emit prange loops, but
+    usable without Numba installed), then the plain Python definition above.
+    """
+    global _compiled_vested_batch
+    if _compiled_vested_batch is None:
+        try:
+            from calculator_kernels_jit import _vested_batch_parallel
+            _compiled_vested_batch = _vested_batch_parallel
+        except ImportError:  # numba is optional
+            try:
+                from vesting_kernels import vested_batch
+                _compiled_vested_batch = vested_batch
+            except ImportError:
+                _compiled_vested_batch = _vested_batch
+    return _compiled_vested_batch
@@ -0,0 +1,21 @@
+"""
+Numba-compiled batch vesting kernel.
+
+Imported lazily by calculator_kernels._get_compiled_vested_batch so Numba is
+only loaded for large batches. Compiled code is cached to __pycache__.
+"""
+
+import numpy as np
+from numba import njit, prange
+from calculator_kernels import _vested
+
+_vested_jit = njit(cache=True)(_vested)
+
+
+@njit(cache=True, parallel=True)
+def _vested_batch_parallel(shares_arr, months_arr, cliff, vesting):
+    """Parallel counterpart of calculator_kernels._vested_batch"""
+    out = np.empty(shares_arr.shape[0], dtype=np.int64)
+    for i in prange(shares_arr.shape[0]):
+        out[i] = _vested_jit(shares_arr[i], months_arr[i], cliff, vesting)
+    return out
@@ -5,7 +5,7 @@ Example usage of the co-founder stock calculator
 
 from datetime import date, timedelta
 from models import Company, Founder, VestingSchedule, FundingRound
-from validators import StockValidator
+from validators import StockValidator, scan_founders
 
 # Example 1: Basic company setup
 print("=== Example 1: Basic Company Setup ===")
@@ -23,14 +23,17 @@ for founder in founders:
 
 # Display cap table
 print("\nCap Table:")
-for entry in company.get_cap_table():
-    print(f"{entry['founder']}: {entry['shares']:,} shares ({entry['ownership_pct']:.1f}%)")
+print("\n".join(
+    f"{entry['founder']}: {entry['shares']:,} shares ({entry['ownership_pct']:.1f}%)"
+    for entry in company.get_cap_table()
+))
 
 # Example 2: Vesting calculation
 print("\n=== Example 2: Vesting Calculation ===")
 current_date = date(2024, 7, 1)  # 6 months after start
 
 print(f"Vesting status as of {current_date}:")
+vesting_lines = []
 for founder in company.founders:
     schedule = VestingSchedule(
         founder=founder,
@@ -43,7 +46,8 @@ for founder in company.founders:
     unvested = schedule.calculate_unvested_shares(current_date)
     vested_pct = (vested / founder.shares) * 100
     
-    print(f"{founder.name}: {vested:,} vested, {unvested:,} unvested ({vested_pct:.1f}%)")
+    vesting_lines.append(f"{founder.name}: {vested:,} vested, {unvested:,} unvested ({vested_pct:.1f}%)")
+print("\n".join(vesting_lines))
 
 # Example 3: Funding round simulation
 print("\n=== Example 3: Series A Funding Round ===")
@@ -64,16 +68,19 @@ print("\nDilution Analysis:")
 total_shares_before = company.get_total_founder_shares()
 total_shares_after = total_shares_before + funding_round.new_shares
 
+dilution_lines = []
 for founder in company.founders:
     original_pct = (founder.shares / total_shares_before) * 100
     new_pct = (founder.shares / total_shares_after) * 100
     dilution = original_pct - new_pct
     
-    print(f"{founder.name}: {original_pct:.1f}% → {new_pct:.1f}% (dilution: {dilution:.1f}%)")
+    dilution_lines.append(f"{founder.name}: {original_pct:.1f}% → {new_pct:.1f}% (dilution: {dilution:.1f}%)")
+print("\n".join(dilution_lines))
 
 # Example 4: Validation and recommendations
 print("\n=== Example 4: Validation ===")
-issues = StockValidator.validate_company_setup(company)
+scan = scan_founders(company)
+issues = StockValidator.validate_company_setup(company, scan)
 if issues:
     print("Validation issues:")
     for issue in issues:
@@ -81,7 +88,7 @@ if issues:
 else:
     print("✓ Company setup is valid")
 
-recommendations = StockValidator.get_recommendations(company)
+recommendations = StockValidator.get_recommendations(company, scan)
 if recommendations:
     print("\nRecommendations:")
     for rec in recommendations:
@@ -1,6 +1,9 @@
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Tuple
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator, validator
+from calculator_kernels import _vested
 
 
 class Founder(BaseModel):
@@ -15,11 +18,26 @@ class Founder(BaseModel):
         return v.strip()
 
 
-class VestingSchedule(BaseModel):
+@dataclass(slots=True)
+class VestingSchedule:
     founder: Founder
-    cliff_months: int = Field(default=12, ge=0, le=48)
-    vesting_months: int = Field(default=48, ge=12, le=60)
     vesting_start: date
+    cliff_months: int = 12
+    vesting_months: int = 48
+    
+    def __post_init__(self) -> None:
+        # Founder is already validated; only the schedule fields need checking
+        if not isinstance(self.founder, Founder):
+            raise TypeError('founder must be a Founder')
+        # datetime subclasses date but can't be compared with one, and bool subclasses int
+        if type(self.vesting_start) is not date:
+            raise TypeError('vesting_start must be a date')
+        if type(self.cliff_months) is not int or type(self.vesting_months) is not int:
+            raise TypeError('cliff_months and vesting_months must be integers')
+        if not 0 <= self.cliff_months <= 48:
+            raise ValueError('cliff_months must be between 0 and 48')
+        if not 12 <= self.vesting_months <= 60:
+            raise ValueError('vesting_months must be between 12 and 60')
     
     def calculate_vested_shares(self, current_date: date) -> int:
         if current_date < self.vesting_start:
@@ -28,42 +46,50 @@ class VestingSchedule(BaseModel):
         months_elapsed = (current_date.year - self.vesting_start.year) * 12 + \
                         (current_date.month - self.vesting_start.month)
         
-        if months_elapsed < self.cliff_months:
-            return 0
-            
-        if months_elapsed >= self.vesting_months:
-            return self.founder.shares
-            
-        vested_portion = (months_elapsed - self.cliff_months) / (self.vesting_months - self.cliff_months)
-        return int(self.founder.shares * vested_portion)
+        return int(_vested(self.founder.shares, months_elapsed, self.cliff_months, self.vesting_months))
     
     def calculate_unvested_shares(self, current_date: date) -> int:
         return self.founder.shares - self.calculate_vested_shares(current_date)
 
 
 class Company(BaseModel):
+    # founders is an immutable tuple and reassignment is validated, so the
+    # cached share total can't drift from the founders actually listed
+    model_config = ConfigDict(validate_assignment=True)
+    
     name: str = Field(min_length=1, description="Company name")
     total_shares: int = Field(gt=0, description="Total authorized shares")
-    founders: List[Founder] = Field(default_factory=list)
+    founders: Tuple[Founder, ...] = Field(default_factory=tuple)
+    _total_founder_shares: int = PrivateAttr(default=0)
+    
+    @model_validator(mode='after')
+    def sync_total_founder_shares(self) -> 'Company':
+        self._total_founder_shares = sum(f.shares for f in self.founders)
+        return self
     
     def add_founder(self, founder: Founder) -> None:
-        self.founders.append(founder)
+        self.founders = (*self.founders, founder)
     
     def get_total_founder_shares(self) -> int:
-        return sum(f.shares for f in self.founders)
+        return self._total_founder_shares
     
     def get_remaining_shares(self) -> int:
         return self.total_shares - self.get_total_founder_shares()
     
     def get_cap_table(self) -> List[dict]:
-        total_founder_shares = self.get_total_founder_shares()
+        shares = np.fromiter((f.shares for f in self.founders), dtype=np.int64, count=len(self.founders))
+        total_founder_shares = shares.sum()
+        if total_founder_shares > 0:
+            ownership_pcts = shares / total_founder_shares * 100.0
+        else:
+            ownership_pcts = np.zeros(shares.shape)
         return [
             {
                 'founder': f.name,
-                'shares': f.shares,
-                'ownership_pct': (f.shares / total_founder_shares * 100) if total_founder_shares > 0 else 0
+                'shares': s,
+                'ownership_pct': pct
             }
-            for f in self.founders
+            for f, s, pct in zip(self.founders, shares.tolist(), ownership_pcts.tolist())
         ]
 
 
@@ -0,0 +1,53 @@
+from datetime import date, datetime
+
+import pytest
+
+from models import Company, Founder, VestingSchedule
+
+
+def _founder(name, shares):
+    return Founder(name=name, shares=shares, start_date=date(2024, 1, 1))
+
+
+def test_total_founder_shares_tracks_founders():
+    company = Company(name="TechCorp", total_shares=100, founders=[_founder("Alice", 10)])
+    assert company.get_total_founder_shares() == 10
+
+    company.add_founder(_founder("Bob", 20))
+    assert company.get_total_founder_shares() == 30
+
+    company.founders = [_founder("Charlie", 5)]
+    assert company.get_total_founder_shares() == 5
+
+    company.founders = []
+    assert company.get_total_founder_shares() == 0
+    assert company.get_remaining_shares() == 100
+
+
+def test_founders_cannot_be_mutated_in_place():
+    company = Company(name="TechCorp", total_shares=100, founders=[_founder("Alice", 10)])
+    with pytest.raises(AttributeError):
+        company.founders.append(_founder("Bob", 20))
+    assert company.get_total_founder_shares() == 10
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"vesting_start": "2024-01-01"},
+    {"vesting_start": datetime(2024, 1, 1)},
+    {"vesting_start": date(2024, 1, 1), "cliff_months": True},
+    {"vesting_start": date(2024, 1, 1), "vesting_months": "48"},
+])
+def test_vesting_schedule_rejects_wrong_types(kwargs):
+    with pytest.raises(TypeError):
+        VestingSchedule(founder=_founder("Alice", 10), **kwargs)
+
+
+@pytest.mark.parametrize("cliff_months, vesting_months", [(-1, 48), (49, 48), (12, 11), (12, 61)])
+def test_vesting_schedule_rejects_out_of_range_months(cliff_months, vesting_months):
+    with pytest.raises(ValueError):
+        VestingSchedule(
+            founder=_founder("Alice", 10),
+            vesting_start=date(2024, 1, 1),
+            cliff_months=cliff_months,
+            vesting_months=vesting_months
+        )
@@ -0,0 +1,57 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from calculator import _NUMBA_THRESHOLD, _compute_vesting, _vested_numpy
+from calculator_kernels import _get_compiled_vested_batch, _vested_batch
+from models import Founder, VestingSchedule
+
+
+def _grants(n):
+    rng = np.random.default_rng(n)
+    shares = rng.integers(1, 200_000, size=n, dtype=np.int64)
+    shares[0] = 180
+    months = rng.integers(-1, 60, size=n).astype(np.int32)
+    months[0] = 35
+    return shares, months
+
+
+def _scalar(shares, months, cliff, vest):
+    return [
+        VestingSchedule(
+            founder=Founder(name="f", shares=s, start_date=date(2020, 1, 1)),
+            vesting_start=date(2020, 1, 1),
+            cliff_months=cliff,
+            vesting_months=vest
+        ).calculate_vested_shares(date(2020 + m // 12, m % 12 + 1, 1)) if m >= 0 else 0
+        for s, m in zip(shares.tolist(), months.tolist())
+    ]
+
+
+@pytest.mark.parametrize("cliff, vest", [(12, 48), (0, 12), (0, 60), (24, 24), (48, 12)])
+@pytest.mark.parametrize("n", [_NUMBA_THRESHOLD - 1, _NUMBA_THRESHOLD, _NUMBA_THRESHOLD + 1])
+def test_vesting_paths_agree_near_threshold(n, cliff, vest):
+    shares, months = _grants(n)
+    expected = _scalar(shares, months, cliff, vest)
+
+    assert _compute_vesting(shares, months, cliff, vest).tolist() == expected
+    assert _vested_numpy(shares, months, cliff, vest).tolist() == expected
+    assert _vested_batch(shares, months, cliff, vest).tolist() == expected
+    assert _get_compiled_vested_batch()(shares, months, cliff, vest).tolist() == expected
+
+
+def test_vested_keeps_baseline_truncation():
+    founder = Founder(name="f", shares=180, start_date=date(2024, 1, 1))
+    schedule = VestingSchedule(founder=founder, vesting_start=date(2024, 1, 1))
+    assert schedule.calculate_vested_shares(date(2026, 12, 1)) == 114
+
+
+@pytest.mark.parametrize("cliff, vest", [(12, 48), (24, 24), (48, 12)])
+def test_jit_batch_kernel_matches_python(cliff, vest):
+    pytest.importorskip("numba")
+    from calculator_kernels_jit import _vested_batch_parallel
+
+    shares, months = _grants(_NUMBA_THRESHOLD)
+    expected = _vested_batch(shares, months, cliff, vest).tolist()
+    assert _vested_batch_parallel(shares, months, cliff, vest).tolist() == expected
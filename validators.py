@@ -1,5 +1,6 @@
+import sys
 from datetime import date
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 from models import Company, Founder, FundingRound
 
 
@@ -8,13 +9,50 @@ class ValidationError(Exception):
     pass
 
 
+class FounderScan(NamedTuple):
+    min_shares: int
+    max_shares: int
+    has_duplicate_names: bool
+
+
+def scan_founders(company: Company) -> FounderScan:
+    """Collect share extremes and name uniqueness in a single pass over founders
+    
+    Compute once per action and pass to both validate_company_setup and
+    get_recommendations so founders are only walked once.
+    """
+    min_shares = sys.maxsize
+    max_shares = 0
+    seen = set()
+    duplicate = False
+    
+    for founder in company.founders:
+        shares = founder.shares
+        if shares < min_shares:
+            min_shares = shares
+        if shares > max_shares:
+            max_shares = shares
+        
+        key = founder.name.strip().lower()
+        if key in seen:
+            duplicate = True
+        seen.add(key)
+    
+    if not company.founders:
+        min_shares = 0
+    
+    return FounderScan(min_shares, max_shares, duplicate)
+
+
 class StockValidator:
     """Validates stock calculations and business logic"""
     
     @staticmethod
-    def validate_company_setup(company: Company) -> List[str]:
+    def validate_company_setup(company: Company, scan: Optional[FounderScan] = None) -> List[str]:
         """Validate company setup and return list of issues"""
         issues = []
+        if scan is None:
+            scan = scan_founders(company)
         
         if not company.name or not company.name.strip():
             issues.append("Company name cannot be empty")
@@ -25,15 +63,14 @@ class StockValidator:
         if not company.founders:
             issues.append("At least one founder must be added")
         
-        total_founder_shares = sum(f.shares for f in company.founders)
+        total_founder_shares = company.get_total_founder_shares()
         if total_founder_shares > company.total_shares:
             issues.append(f"Total founder shares ({total_founder_shares:,}) exceeds authorized shares ({company.total_shares:,})")
         
         if total_founder_shares == 0:
             issues.append("Total founder shares cannot be zero")
         
-        founder_names = [f.name.strip().lower() for f in company.founders]
-        if len(founder_names) != len(set(founder_names)):
+        if scan.has_duplicate_names:
             issues.append("Founder names must be unique")
         
         return issues
@@ -53,9 +90,9 @@ class StockValidator:
         if new_founder.name.strip().lower() in existing_names:
             issues.append(f"Founder '{new_founder.name}' already exists")
         
-        total_shares_after = sum(f.shares for f in company.founders) + new_founder.shares
+        total_shares_after = company.get_total_founder_shares() + new_founder.shares
         if total_shares_after > company.total_shares:
-            remaining = company.total_shares - sum(f.shares for f in company.founders)
+            remaining = company.get_remaining_shares()
             issues.append(f"Cannot add {new_founder.shares:,} shares. Only {remaining:,} shares remaining")
         
         return issues
@@ -97,9 +134,11 @@ class StockValidator:
         return issues
     
     @staticmethod
-    def get_recommendations(company: Company) -> List[str]:
+    def get_recommendations(company: Company, scan: Optional[FounderScan] = None) -> List[str]:
         """Provide business recommendations based on setup"""
         recommendations = []
+        if scan is None:
+            scan = scan_founders(company)
         
         if len(company.founders) == 1:
             recommendations.append("Consider adding co-founders to distribute risk and expertise")
@@ -107,18 +146,15 @@ class StockValidator:
         if len(company.founders) > 4:
             recommendations.append("Large founder teams may face coordination challenges")
         
-        total_founder_shares = sum(f.shares for f in company.founders)
+        total_founder_shares = company.get_total_founder_shares()
         if total_founder_shares < company.total_shares * 0.6:
             recommendations.append("Consider reserving more shares for future employees/investors")
         
         if total_founder_shares > company.total_shares * 0.9:
             recommendations.append("Consider reserving more shares for future funding rounds")
         
-        founder_shares = [f.shares for f in company.founders]
-        if founder_shares:
-            max_shares = max(founder_shares)
-            min_shares = min(founder_shares)
-            ratio = max_shares / min_shares if min_shares > 0 else float('inf')
+        if company.founders:
+            ratio = scan.max_shares / scan.min_shares if scan.min_shares > 0 else float('inf')
             
             if ratio > 5:
                 recommendations.append("Large equity disparities may create future conflicts")